@@ -67,12 +67,12 @@ class FormatBase:
         raise NotImplementedError("Writing is not supported for this format")
 
     @classmethod
-    def guess_format(cls, text: str) -> Optional[str]:
+    def guess_format(cls, text: bytes) -> Optional[str]:
         """
         Return format identifier of recognized format, or None.
 
         Arguments:
-            text (str): Content of subtitle file. When the file is long,
+            text (bytes): Content of subtitle file. When the file is long,
                 this may be only its first few thousand characters.
 
         Returns:
@@ -35,6 +35,9 @@ FORMAT_IDENTIFIER_TO_FORMAT_CLASS: Dict[str, Type[FormatBase]] = {
 
 FORMAT_IDENTIFIERS = list(FORMAT_IDENTIFIER_TO_FORMAT_CLASS.keys())
 
+#: Size of the leading part of content tried first by :func:`autodetect_format()`.
+QUICK_DETECT_SIZE = 2000
+
 
 def get_format_class(format_: str) -> Type[FormatBase]:
     """Format identifier -> format class (ie. subclass of FormatBase)"""
@@ -64,8 +67,29 @@ def get_file_extension(format_: str) -> str:
     raise RuntimeError(f"No file extension for format {format_!r}")
 
 
-def autodetect_format(content: str) -> str:
-    """Return format identifier for given fragment or raise FormatAutodetectionError."""
+def autodetect_format(content: bytes) -> str:
+    """
+    Return format identifier for given fragment or raise FormatAutodetectionError.
+
+    Lines within the first :data:`QUICK_DETECT_SIZE` bytes are tried first,
+    the whole fragment is only examined when they are inconclusive (no format
+    or multiple formats). Note that a head which matches exactly one format
+    decides the result, even if the rest of the fragment would also match
+    another format.
+
+    """
+    if len(content) > QUICK_DETECT_SIZE:
+        head_end = content.rfind(b"\n", 0, QUICK_DETECT_SIZE)
+        if head_end > 0:
+            try:
+                return _autodetect_format(content[:head_end+1])
+            except FormatAutodetectionError:
+                pass
+
+    return _autodetect_format(content)
+
+
+def _autodetect_format(content: bytes) -> str:
     formats = set()
     for impl in FORMAT_IDENTIFIER_TO_FORMAT_CLASS.values():
         guess = impl.guess_format(content)
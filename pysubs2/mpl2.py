@@ -33,7 +33,7 @@ class MPL2Format(FormatBase):
             return b"\\N".join(out)
 
         subs.events = [SSAEvent(start=times_to_ms(s=float(start) / 10), end=times_to_ms(s=float(end) / 10),
-                       text=prepare_text(text)) for start, end, text in MPL2_FORMAT.findall(fp.getvalue())]
+                       text=prepare_text(text)) for start, end, text in MPL2_FORMAT.findall(fp.read())]
 
     @classmethod
     def to_file(cls, subs, fp, format_, **kwargs):
@@ -104,7 +104,7 @@ class SSAFile(MutableSequence):
     @classmethod
     def from_bytes(cls, _bytes: bytes, format_: Optional[str]=None, fps: Optional[float]=None, **kwargs) -> "SSAFile":
         """
-        Load subtitle file from string.
+        Load subtitle file from bytestring.
 
         See :meth:`SSAFile.load()` for full description.
 
@@ -115,12 +115,12 @@ class SSAFile(MutableSequence):
             SSAFile
 
         Example:
-            >>> text = '''
+            >>> text = b'''
             ... 1
             ... 00:00:00,000 --> 00:00:05,000
             ... An example SubRip file.
             ... '''
-            >>> subs = SSAFile.from_string(text)
+            >>> subs = SSAFile.from_bytes(text)
 
         """
         fp = io.BytesIO(_bytes)
@@ -135,7 +135,7 @@ class SSAFile(MutableSequence):
 
         Note:
             This is a low-level method. Usually, one of :meth:`SSAFile.load()`
-            or :meth:`SSAFile.from_string()` is preferable.
+            or :meth:`SSAFile.from_bytes()` is preferable.
 
         Arguments:
             fp (file object): A file object, ie. :class:`io.RawIOBase` instance.
@@ -147,12 +147,19 @@ class SSAFile(MutableSequence):
         """
         if format_ is None:
             # Autodetect subtitle format, then read again using correct parser.
-            # The file might be a pipe and we need to read it twice,
-            # so just buffer everything.
-            _bytes = fp.read()
-            fragment = _bytes[:10000]
-            format_ = autodetect_format(fragment)
-            fp = io.BytesIO(_bytes)
+            if hasattr(fp, "seekable") and fp.seekable():
+                # Only the fragment is needed for detection, rewind and let the parser read the file.
+                pos = fp.tell()
+                fragment = fp.read(10000)
+                format_ = autodetect_format(fragment)
+                fp.seek(pos)
+            else:
+                # The file might be a pipe and we need to read it twice,
+                # so just buffer everything.
+                _bytes = fp.read()
+                fragment = _bytes[:10000]
+                format_ = autodetect_format(fragment)
+                fp = io.BytesIO(_bytes)
 
         impl = get_format_class(format_)
         subs = cls() # an empty subtitle file
@@ -257,7 +264,10 @@ class SSAFile(MutableSequence):
 
         """
         delta = make_time(h=h, m=m, s=s, ms=ms, frames=frames, fps=fps)
-        for line in self:
+        if delta == 0:
+            return
+
+        for line in self.events:
             line.start += delta
             line.end += delta
 
@@ -280,9 +290,10 @@ class SSAFile(MutableSequence):
             raise ValueError(f"Framerates must be positive, cannot transform {in_fps} -> {out_fps}")
 
         ratio = in_fps / out_fps
-        for line in self:
-            line.start = int(round(line.start * ratio))
-            line.end = int(round(line.end * ratio))
+        for line in self.events:
+            # round() of a float already returns int
+            line.start = round(line.start * ratio)
+            line.end = round(line.end * ratio)
 
     # ------------------------------------------------------------------------
     # Working with styles
@@ -309,10 +320,12 @@ class SSAFile(MutableSequence):
         if not is_valid_field_content(new_name):
             raise ValueError(f"{new_name!r} is not a valid name")
 
-        self.styles[new_name] = self.styles[old_name]
-        del self.styles[old_name]
+        # rename in place, keeping order of styles
+        styles = {(new_name if name == old_name else name): style for name, style in self.styles.items()}
+        self.styles.clear()
+        self.styles.update(styles)
 
-        for line in self:
+        for line in self.events:
             # XXX also handle \r override tag
             if line.style == old_name:
                 line.style = new_name
@@ -375,7 +388,7 @@ class SSAFile(MutableSequence):
         Equality of two SSAFiles.
 
         Compares :attr:`SSAFile.info`, :attr:`SSAFile.styles` and :attr:`SSAFile.events`.
-        Order of entries in OrderedDicts does not matter. "ScriptType" key in info is
+        Order of entries in dicts does not matter. "ScriptType" key in info is
         considered an implementation detail and thus ignored.
 
         Useful mostly in unit tests. Differences are logged at DEBUG level.
@@ -438,6 +451,9 @@ class SSAFile(MutableSequence):
                 return False
 
             for i, (self_event, other_event) in enumerate(zip(self.events, other.events)):
+                if self_event is other_event:
+                    # shared event objects, eg. a shallow copy of the file
+                    continue
                 if not self_event.equals(other_event):
                     for k in self_event.FIELDS:
                         if getattr(self_event, k) != getattr(other_event, k): logging.debug("difference in field %r", k)
@@ -521,3 +537,11 @@ class SSAFile(MutableSequence):
             self.events.insert(index, value)
         else:
             raise TypeError("SSAFile.events must contain only SSAEvent objects")
+
+    def extend(self, values: Iterable[SSAEvent]):
+        # faster than the MutableSequence mixin, which calls insert() for each value
+        values = list(values)
+        if all(isinstance(v, SSAEvent) for v in values):
+            self.events.extend(values)
+        else:
+            raise TypeError("SSAFile.events must contain only SSAEvent objects")
@@ -5,11 +5,31 @@ from .formatbase import FormatBase
 from .ssaevent import SSAEvent
 from .ssastyle import SSAStyle
 from .substation import parse_tags
-from .time import ms_to_times, make_time, TIMESTAMP_SHORT, timestamp_to_ms
+from .time import ms_to_times, make_time
 
 #: Pattern that matches TMP line
 TMP_LINE = re.compile(rb"(\d{1,2}:\d{2}:\d{2}):(.+)")
 
+#: Pattern that matches each TMP line (including the newline) in the whole file
+TMP_LINE_MULTI = re.compile(rb"^(\d{1,2}):(\d{2}):(\d{2}):([^\n]+)\n?", re.MULTILINE)
+
+#: Pattern that matches a TMP line at the start of text (for format detection)
+_TMP_LINE_START = re.compile(rb"\d{1,2}:\d{2}:\d{2}:[^\r\n]")
+
+#: Patterns that find a TMP line after LF or bare CR line ending (for format detection);
+#: the literal first character lets the regex engine skip ahead quickly to candidate positions
+_TMP_LINE_AFTER_LF = re.compile(rb"\n\d{1,2}:\d{2}:\d{2}:[^\r\n]")
+_TMP_LINE_AFTER_CR = re.compile(rb"\r\d{1,2}:\d{2}:\d{2}:[^\r\n]")
+
+#: Pattern that matches opening underline tag
+_U_TAG_RE = re.compile(rb"< *u *>")
+
+#: Pattern that matches any other HTML tag
+_HTML_TAG_RE = re.compile(rb"< */? *[a-zA-Z][^>]*>")
+
+#: Pattern that matches runs of newlines
+_NL_COLLAPSE_RE = re.compile(b"\n+")
+
 #: Largest timestamp allowed in Tmp, ie. 99:59:59.
 MAX_REPRESENTABLE_TIME = make_time(h=99, m=59, s=59)
 
@@ -18,15 +38,15 @@ class TmpFormat(FormatBase):
     """TMP subtitle format implementation"""
 
     @staticmethod
-    def ms_to_timestamp(ms: int) -> str:
-        """Convert ms to 'HH:MM:SS'"""
+    def ms_to_timestamp(ms: int) -> bytes:
+        """Convert ms to b'HH:MM:SS'"""
         if ms < 0:
             ms = 0
-        if ms > MAX_REPRESENTABLE_TIME:
+        elif ms > MAX_REPRESENTABLE_TIME:
             warnings.warn("Overflow in TMP timestamp, clamping to MAX_REPRESENTABLE_TIME", RuntimeWarning)
             ms = MAX_REPRESENTABLE_TIME
         h, m, s, _ = ms_to_times(ms)
-        return f"{h:02d}:{m:02d}:{s:02d}"
+        return b"%02d:%02d:%02d" % (h, m, s)
 
     @classmethod
     def guess_format(cls, text):
@@ -35,39 +55,41 @@ class TmpFormat(FormatBase):
             # disambiguation vs. SSA/ASS
             return None
 
-        for line in text.splitlines():
-            if TMP_LINE.match(line) and len(TMP_LINE.findall(line)) == 1:
-                return "tmp"
+        # TMP_LINE ends with greedy (.+), so it can never match twice on a single line;
+        # it's enough to search for one line starting with a timestamp
+        if (_TMP_LINE_START.match(text)
+                or _TMP_LINE_AFTER_LF.search(text)
+                or (b"\r" in text and _TMP_LINE_AFTER_CR.search(text))):
+            return "tmp"
 
     @classmethod
     def from_file(cls, subs, fp, format_, **kwargs):
         """See :meth:`pysubs2.formats.FormatBase.from_file()`"""
         events = []
+        prev = None
 
         def prepare_text(text):
             text = text.replace(b"|", rb"\N")  # convert newlines
-            text = re.sub(rb"< *u *>", b"{\\\\u1}", text) # not rb" for Python 2.7 compat, triggers unicodeescape
-            text = re.sub(rb"< */? *[a-zA-Z][^>]*>", b"", text) # strip other HTML tags
+            if b"<" in text:  # most lines have no tags, skip the regexes for them
+                text = _U_TAG_RE.sub(b"{\\\\u1}", text) # not rb" for Python 2.7 compat, triggers unicodeescape
+                text = _HTML_TAG_RE.sub(b"", text) # strip other HTML tags
             return text
 
-        for line in fp:
-            match = TMP_LINE.match(line)
-            if not match:
-                continue
-
-            start, text = match.groups()
-            start = timestamp_to_ms(TIMESTAMP_SHORT.match(start).groups())
+        for match in TMP_LINE_MULTI.finditer(fp.read()):
+            h, m, s, text = match.groups()
+            start = ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000
+            line_length = match.end() - match.start()
 
             # Unfortunately, end timestamp is not given; try to estimate something reasonable:
             # start + 500 ms + 67 ms/character (15 chars per second)
-            end_guess = start + 500 + (len(line) * 67)
+            end_guess = start + 500 + (line_length * 67)
 
-            event = SSAEvent(start=start, end=end_guess, text=prepare_text(text))
-            events.append(event)
+            # correct overlap of previous subtitle created by its end_guess
+            if prev is not None and prev.end > start:
+                prev.end = start
 
-        # correct any overlapping subtitles created by end_guess
-        for i in range(len(events) - 1):
-            events[i].end = min(events[i].end, events[i+1].start)
+            prev = SSAEvent(start=start, end=end_guess, text=prepare_text(text))
+            events.append(prev)
 
         subs.events = events
 
@@ -90,21 +112,30 @@ class TmpFormat(FormatBase):
                 fragment = fragment.replace(rb"\n", b"\n")
                 fragment = fragment.replace(rb"\N", b"\n")
                 if apply_styles:
-                    if sty.italic: fragment = f"<i>{fragment}</i>"
-                    if sty.underline: fragment = f"<u>{fragment}</u>"
-                    if sty.strikeout: fragment = f"<s>{fragment}</s>"
+                    if sty.italic: fragment = b"<i>" + fragment + b"</i>"
+                    if sty.underline: fragment = b"<u>" + fragment + b"</u>"
+                    if sty.strikeout: fragment = b"<s>" + fragment + b"</s>"
                 if sty.drawing: skip = True
                 body.append(fragment)
 
             if skip:
-                return ""
+                return b""
             else:
-                return re.sub(b"\n+", b"\n", "".join(body).strip())
+                return _NL_COLLAPSE_RE.sub(b"\n", b"".join(body).strip())
 
         visible_lines = (line for line in subs if not line.is_comment)
 
+        # consecutive lines usually share style, only look it up when it changes
+        style_name, style = object(), None
+        parts = []
+
         for line in visible_lines:
             start = cls.ms_to_timestamp(line.start)
-            text = prepare_text(line.text, subs.styles.get(line.style, SSAStyle.DEFAULT_STYLE))
+            if line.style != style_name:
+                style_name = line.style
+                style = subs.styles.get(style_name, SSAStyle.DEFAULT_STYLE)
+            text = prepare_text(line.text, style)
+
+            parts += (start, b":", text, b"\n")
 
-            print(start + b":" + text, end="\n", file=fp)
+        fp.write(b"".join(parts))
@@ -16,3 +16,22 @@ def test_identifier_to_ext():
 def test_format_detection_fail():
     with pytest.raises(pysubs2.FormatAutodetectionError):
         pysubs2.formats.autodetect_format("")
+
+def test_format_detection_quick():
+    srt_event = b"1\n00:00:01,000 --> 00:00:02,000\nhi\n\n"
+    content = srt_event * (pysubs2.formats.QUICK_DETECT_SIZE // len(srt_event) + 10)
+    assert pysubs2.formats.autodetect_format(content) == "srt"
+
+def test_format_detection_past_quick_head():
+    content = b"\n" * pysubs2.formats.QUICK_DETECT_SIZE + b"00:00:12:text\n"
+    assert pysubs2.formats.autodetect_format(content) == "tmp"
+
+def test_format_detection_head_wins_over_later_ambiguity():
+    srt_event = b"1\n00:00:01,000 --> 00:00:02,000\nhi\n\n"
+    srt_head = srt_event * (pysubs2.formats.QUICK_DETECT_SIZE // len(srt_event) + 10)
+    content = srt_head + b"[10][20]mpl2 line\n"
+    assert pysubs2.formats.autodetect_format(content) == "srt"
+
+    # ambiguity within the head is still reported
+    with pytest.raises(pysubs2.FormatAutodetectionError):
+        pysubs2.formats.autodetect_format(b"[10][20]mpl2 line\n" + srt_head)
@@ -1,3 +1,4 @@
+import io
 import pytest
 
 from pysubs2 import SSAFile, SSAStyle, SSAEvent, make_time
@@ -30,6 +31,15 @@ def test_shift():
     with pytest.raises(ValueError):
         subs.shift(frames=5, fps=-1)
 
+    with pytest.raises(ValueError):
+        subs.shift(frames=0)
+
+    subs.append(SSAEvent(start=1000, end=2000))
+    subs.shift(s=1)
+    subs.shift(ms=0.4)
+    subs.shift(frames=0, fps=25)
+    assert subs[0] == SSAEvent(start=2000, end=3000)
+
 def test_import_styles():
     red1 = SSAStyle()
     red2 = SSAStyle()
@@ -70,6 +80,7 @@ def test_rename_style():
     subs.rename_style("red", "blue")
     assert "red" not in subs.styles
     assert subs.styles["blue"] is red
+    assert list(subs.styles) == ["blue", "green"]
     assert subs[0].style == "blue"
     assert subs[1].style == "unrelated"
 
@@ -86,6 +97,18 @@ def test_rename_style():
     with pytest.raises(KeyError):
         subs.rename_style("nonexistent-style", "blue")
 
+def test_rename_style_keeps_order():
+    subs = SSAFile()
+    red, green, blue = SSAStyle(), SSAStyle(), SSAStyle()
+    subs.styles = styles = {b"red": red, b"green": green, b"blue": blue}
+    subs.events = [SSAEvent(style=b"green"), SSAEvent(style=b"red")]
+
+    subs.rename_style(b"green", b"yellow")
+    assert subs.styles is styles
+    assert list(subs.styles) == [b"red", b"yellow", b"blue"]
+    assert subs.styles[b"yellow"] is green
+    assert [e.style for e in subs] == [b"yellow", b"red"]
+
 def test_transform_framerate():
     subs = SSAFile()
     subs.append(SSAEvent(start=0, end=10))
@@ -114,6 +137,16 @@ def test_insertion_of_wrong_type():
         subs.insert(42)
     with pytest.raises(TypeError):
         subs[0] = 42
+    with pytest.raises(TypeError):
+        subs.extend([SSAEvent(), 42])
+    assert len(subs) == 1
+
+def test_extend():
+    subs = SSAFile()
+    subs.append(SSAEvent(start=0))
+    subs.extend(SSAEvent(start=i) for i in (1, 2))
+    subs += [SSAEvent(start=3)]
+    assert [e.start for e in subs] == [0, 1, 2, 3]
 
 def test_slice_api():
     subs = SSAFile()
@@ -139,3 +172,44 @@ def test_slice_api():
     assert subs[0].text == "X"
     assert subs[1].text == "Y"
     assert subs[2].text == "Z"
+
+TMP_CONTENT = b"00:00:12:first\n00:00:14:second\n"
+MPL2_CONTENT = b"[120][140]first\n[140][160]second\n"
+SRT_CONTENT = b"1\n00:00:12,000 --> 00:00:14,000\nfirst\n\n2\n00:00:14,000 --> 00:00:16,000\nsecond\n"
+
+class NonSeekableBytesIO(io.BytesIO):
+    def seekable(self):
+        return False
+
+def test_from_file_autodetect_seekable():
+    fp = io.BytesIO(b"garbage" + TMP_CONTENT)
+    fp.seek(len(b"garbage"))
+    subs = SSAFile.from_file(fp)
+    assert subs.format == "tmp"
+    assert [e.text for e in subs] == [b"first", b"second"]
+
+def test_from_file_autodetect_seekable_mpl2():
+    fp = io.BytesIO(b"garbage\n[0][1]skipped\n" + MPL2_CONTENT)
+    fp.seek(len(b"garbage\n[0][1]skipped\n"))
+    subs = SSAFile.from_file(fp)
+    assert subs.format == "mpl2"
+    assert [e.text for e in subs] == [b"first", b"second"]
+
+@pytest.mark.parametrize("format_, content", [("tmp", TMP_CONTENT), ("mpl2", MPL2_CONTENT), ("srt", SRT_CONTENT)])
+def test_load_autodetect(tmp_path, format_, content):
+    path = tmp_path / "subtitles.txt"
+    path.write_bytes(content)
+    subs = SSAFile.load(str(path))
+    assert subs.format == format_
+    assert [e.text for e in subs] == [b"first", b"second"]
+
+def test_from_file_autodetect_non_seekable():
+    subs = SSAFile.from_file(NonSeekableBytesIO(TMP_CONTENT))
+    assert subs.format == "tmp"
+    assert [e.text for e in subs] == [b"first", b"second"]
+
+@pytest.mark.parametrize("format_, content", [("tmp", TMP_CONTENT), ("mpl2", MPL2_CONTENT), ("srt", SRT_CONTENT)])
+def test_from_bytes_autodetect(format_, content):
+    subs = SSAFile.from_bytes(content)
+    assert subs.format == format_
+    assert [e.text for e in subs] == [b"first", b"second"]
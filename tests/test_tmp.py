@@ -3,11 +3,12 @@ pysubs2.formats.tmp tests
 
 """
 
+import io
 from textwrap import dedent
 import pytest
 
 from pysubs2 import SSAFile, SSAEvent, make_time
-from pysubs2.tmp import MAX_REPRESENTABLE_TIME
+from pysubs2.tmp import MAX_REPRESENTABLE_TIME, TmpFormat
 
 def test_simple_write():
     subs = SSAFile()
@@ -106,3 +107,48 @@ def test_overflow_timestamp_write():
         text = ref.to_string("tmp")
     subs = SSAFile.from_string(text)
     assert subs[0].start == MAX_REPRESENTABLE_TIME
+
+def test_guess_format():
+    assert TmpFormat.guess_format(b"00:00:12:text\n") == "tmp"
+    assert TmpFormat.guess_format(b"intro\r\n0:00:12:text\r\n") == "tmp"
+    assert TmpFormat.guess_format(b"intro\r0:00:12:text\r") == "tmp"
+    assert TmpFormat.guess_format(b"intro 00:00:12:text\n") is None
+    assert TmpFormat.guess_format(b"00:00:12:\n00:00:14:\r\n") is None
+    assert TmpFormat.guess_format(b"[Script Info]\n00:00:12:text\n") is None
+
+def test_ms_to_timestamp():
+    assert TmpFormat.ms_to_timestamp(-1) == b"00:00:00"
+    assert TmpFormat.ms_to_timestamp(make_time(h=1, m=2, s=3, ms=999)) == b"01:02:03"
+    with pytest.warns(RuntimeWarning):
+        assert TmpFormat.ms_to_timestamp(make_time(h=100)) == b"99:59:59"
+
+def test_write_bytes_with_styles():
+    subs = SSAFile()
+    subs.append(SSAEvent(start=0, end=1000, text=rb"plain {\i1}italic{\i0}\Nsecond"))
+    subs.append(SSAEvent(start=1000, end=2000, text=rb"{\u1}underline"))
+
+    fp = io.BytesIO()
+    subs.to_file(fp, "tmp")
+    assert fp.getvalue() == b"00:00:00:plain <i>italic</i>\nsecond\n00:00:01:<u>underline</u>\n"
+
+def test_overlapping_read_bytes():
+    # end_guess of each line is start + 500 ms + 67 ms per character of the line
+    content = b"00:00:12:first line\n00:00:13:second\n00:00:20:third\n"
+    subs = SSAFile.from_bytes(content)
+    assert [e.text for e in subs] == [b"first line", b"second", b"third"]
+    assert [(e.start, e.end) for e in subs] == [
+        (12000, 13000),  # end_guess 12000 + 500 + 20*67 = 13840 clamped to next start
+        (13000, 13000 + 500 + 16*67),
+        (20000, 20000 + 500 + 15*67),
+    ]
+
+@pytest.mark.parametrize("content, last_line_length", [
+    (b"00:00:01:a\n00:00:10:last", 13),
+    (b"00:00:01:a\n00:00:10:last\n", 14),
+    (b"00:00:01:a\r\n00:00:10:last\r\n", 15),
+])
+def test_read_end_guess_counts_whole_line(content, last_line_length):
+    # line length used for end_guess includes the timestamp and the line ending, if any
+    subs = SSAFile.from_bytes(content)
+    assert subs[0].end == 1000 + 500 + (len(content.split(b"\n")[0]) + 1) * 67
+    assert subs[1].end == 10000 + 500 + last_line_length * 67